@@ -75,3 +75,5 @@
 # These view wrappers offer flexibility and modularity in organizing your API views.
 # Depending on your requirements, you can choose the appropriate view wrapper to structure your views and leverage the features provided by DRF
 # for authentication, permissions, serialization, and response handling.
+
+# `ListAPIView` builds the full serialized list before rendering it. For large exports see streaming-json-responses.md (`StreamingListMixin`).
@@ -106,3 +106,6 @@ else:
     errors = serializer.errors
 
 # In this example, `validated_data.get('email', instance.email)` ensures that you handle both cases where the 'email' field may or may not be present in the incoming data.
+
+# For large read-only lists, `ModelSerializer(queryset, many=True)` spends most of its time building model instances and calling every field.
+# See DRF-fast-read-serializer.md for a `FastModelSerializer` that serializes straight from `values_list()` rows.
@@ -71,3 +71,12 @@ print(retrieved_data['text'])
 
 # In this example, `retrieved_data` is a Python dictionary, and you can access its values as you would with any Python dictionary.
 # Django handles the conversion between the JSON representation stored in the database and the corresponding Python data types during the retrieval process.
+
+# Filtering on a key (MyModel.objects.filter(data__customer__id=42)) reads the whole table, because a plain
+# JSONField key lookup can't use an index. To index chosen keys and keep the same lookups, see
+# jsonfield-path-indexes.md: expression indexes or generated columns, with data__<path> routed to them.
+
+# Changing one key this way (load, change the dict, save()) sends the whole document back, and two concurrent
+# increments can lose one. To change part of the document in SQL (jsonb_set / json_set), for one row or a whole
+# queryset, see partial-json-updates.md:
+# MyModel.objects.filter(pk=my_instance.pk).json_set('data', 'stats__views', Coalesce(JSONPath('data', 'stats__views', IntegerField()), 0) + 1)
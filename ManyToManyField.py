@@ -46,3 +46,6 @@ class Book(models.Model):
 # >>> author = Author.objects.first()
 # >>> author.books.all()
 # <QuerySet [<Book: Book object (1)>, <Book: Book object (2)>, <Book: Book object (3)>]>
+
+# book.authors.add() / .remove() / .set() run their queries for one book at a time. To sync the authors of
+# thousands of books at once ({book_id: {author_ids}}), see bulk-m2m-sync.md.
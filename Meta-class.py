@@ -46,3 +46,6 @@ class Book(models.Model):
 # In this example, the `Meta` class is used to set the default ordering of query results to be based on the `publication_date` field,
 # and it provides human-readable names for the model in the admin interface.
 # By customizing the `Meta` class within your Django models, you can fine-tune the behavior of your models to better suit your project's requirements and preferences.
+
+# To find out which `indexes` your queries actually need, see index-advisor.md: it replays a recorded
+# query workload, tries candidate indexes and prints the ones worth adding as Meta.indexes and a migration.
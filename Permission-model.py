@@ -105,3 +105,6 @@
 #    - When you add a user to the "Editors" group, they automatically gain the ability to edit blog posts.
 
 # Remember, managing permissions through groups helps organize and streamline access control in your Django application!
+
+# For has_perm() checks without the two permission queries per request, see cached-permissions.md
+# (per-user permission bitsets in the shared cache, invalidated on m2m_changed).
@@ -73,3 +73,5 @@ class MyProtectedView(View):
 # These are just the basics, and class-based views in Django offer a lot of flexibility and extensibility.
 # Understanding the various built-in generic views and mixins can help you write concise and modular code.
 
+
+# Under ASGI, views can be async (`async def get(...)`). `ListView` itself is sync; see async-views.md for an `AsyncListView`.
@@ -73,3 +73,6 @@ book, created = Book.objects.filter(**lookup_kwargs).get_or_create(defaults=defa
 
 # # So, the first element of the tuple is the object itself, which will be either an existing object that matches the lookup criteria or a newly created object.
 # # The second element is a boolean that tells you whether the object was just created during this call or was pre-existing.
+
+# For imports with thousands of rows, calling `get_or_create` in a loop costs 2 to 3 queries per row.
+# See bulk-get-or-create.md for a batched `bulk_get_or_create` manager method.
@@ -83,3 +83,6 @@ class Log(models.Model):
     reader = models.ForeignKey(Reader, on_delete=models.CASCADE)
     book = models.ForeignKey(Book, on_delete=models.CASCADE)
     date_time = models.DateTimeField(auto_now=True, auto_now_add=False)
+
+# Apart from primary keys, unique fields and ForeignKeys, none of these fields is indexed.
+# index-advisor.md shows how to find the Meta.indexes these models need from the queries you run.
@@ -68,3 +68,7 @@ class Book(models.Model):
 
 # It's important to choose the appropriate `on_delete` option based on your application's requirements.
 # This ensures that your database maintains referential integrity and that data is handled correctly when related objects are deleted.
+
+# With CASCADE, deleting an author loads all their books into memory and deletes everything in one transaction.
+# For authors with millions of rows below them, see chunked-cascade-delete.md: leaves-first batches, one
+# commit per batch, resumable after a crash.
@@ -38,3 +38,6 @@ empty_queryset = MyModel.objects.none() # This is the recommended way because .n
 # Now empty_queryset is an empty queryset
 # In this example, we're using the filter() method with a condition that checks if the primary key (pk) is in an empty list. Since no primary key will ever be in an empty list, this queryset will always be empty.
 # You can also create an empty queryset by chaining multiple filter conditions that can never be met, but the method above is a straightforward and clear way to create an empty queryset.
+
+# How many queries a view really runs, and how long they take, is invisible in the code above.
+# See per-view-query-budgets.md for a middleware that records it per view and fails tests over a budget.
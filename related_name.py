@@ -45,3 +45,6 @@ class Person(models.Model):
 # The related_name attribute is set to 'known_by', which means that when you
 # have an instance of the Person model, you can use the 'known_by' attribute
 # to access all the Person instances that know that person.
+
+# Calling `author.books.all()` for every author in a list runs one query per author (the N+1 problem).
+# See n-plus-one-detector.md for a tool that detects this and suggests the prefetch_related/select_related fix.
@@ -36,3 +36,6 @@ python manage.py migrate
 # Notes
 # <img src="{% image.url %} "> url is a method that returns the url of the current image object. It can be used in html to get the source
 
+
+# `image.url` serves the original upload, which is usually far bigger than needed for thumbnails.
+# See image-renditions.md for generating resized AVIF/WebP/JPEG copies in the background and a template tag to use them.
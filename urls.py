@@ -27,4 +27,6 @@ urlpatterns = [
 ]
 
 # This will include the urls from app1 and app2 in the project.
-# This is useful when you want to split your url patterns across multiple apps in a project.
\ No newline at end of file
+# This is useful when you want to split your url patterns across multiple apps in a project.
+# With hundreds of routes, resolving tries each pattern in turn. See compiled-url-resolver.md for a
+# resolver that indexes the patterns in a prefix trie: urlpatterns = compiled([...]).